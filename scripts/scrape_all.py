@@ -2,34 +2,53 @@
 """Scrape all SEP entries to markdown files."""
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 from urllib.parse import urljoin
 
-import httpx
+import orjson
 from bs4 import BeautifulSoup
 
 # Add parent directory to path for sep_scraper imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sep_scraper.cli import scrape_article
-from sep_scraper.fetcher import ScraperError
+from sep_scraper.cli import scrape_article_result
+from sep_scraper.fetcher import NotModified, ScraperError, close_client, get_client
+from sep_scraper.limiter import AdaptiveLimiter
 
 
 BASE_URL = "https://plato.stanford.edu"
 CONTENTS_URL = "https://plato.stanford.edu/contents.html"
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
+CACHE_PATH = OUTPUT_DIR / ".cache.json"
 CONCURRENCY = 20  # Number of concurrent requests
 
 
+def load_cache() -> dict:
+    """Load the per-entry HTTP validator cache (ETag/Last-Modified)."""
+    try:
+        return orjson.loads(CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict) -> None:
+    """Write the validator cache atomically so a SIGINT can't corrupt it."""
+    tmp = CACHE_PATH.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, CACHE_PATH)
+
+
 async def get_all_entry_urls() -> list[str]:
     """Fetch the table of contents and extract all entry URLs."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(CONTENTS_URL)
-        response.raise_for_status()
+    response = await get_client().get(CONTENTS_URL)
+    response.raise_for_status()
 
     soup = BeautifulSoup(response.text, "lxml")
-    urls = set()
+    # Insertion-ordered dict dedup: the TOC is already alphabetical, so
+    # preserving document order makes the final sort redundant
+    urls: dict[str, None] = {}
 
     for link in soup.find_all("a", href=True):
         href = link["href"]
@@ -46,32 +65,61 @@ async def get_all_entry_urls() -> list[str]:
             if not url.endswith("/"):
                 url += "/"
 
-            urls.add(url)
+            urls[url] = None
 
-    return sorted(urls)
+    return list(urls)
 
 
-async def scrape_entry(url: str, output_dir: Path, semaphore: asyncio.Semaphore) -> tuple[str, bool, str]:
+async def scrape_entry(
+    url: str,
+    entry_name: str,
+    output_dir: Path,
+    limiter: AdaptiveLimiter,
+    cache: dict,
+    present: frozenset[str],
+) -> tuple[str, bool, str]:
     """Scrape a single entry and save to file.
 
+    Args:
+        entry_name: Entry name derived from the URL
+        present: Entry names that already have an output file
+
     Returns: (url, success, message)
     """
-    entry_name = url.rstrip("/").split("/")[-1]
     output_path = output_dir / f"{entry_name}.md"
+    cached = cache.get(entry_name, {})
+    exists = entry_name in present
 
-    # Skip if already scraped
-    if output_path.exists():
+    # Skip if already scraped and we have no validators to revalidate with
+    if exists and not cached:
         return (url, True, "exists")
 
-    async with semaphore:
-        try:
-            markdown = await scrape_article(url)
-            output_path.write_text(markdown, encoding="utf-8")
+    try:
+        async with limiter.slot():
+            try:
+                result = await scrape_article_result(
+                    url,
+                    etag=cached.get("etag") if exists else None,
+                    last_modified=cached.get("last_modified") if exists else None,
+                    known_sha=cached.get("sha256") if exists else None,
+                )
+            except NotModified:
+                return (url, True, "unchanged")
+            # Write bytes to a temp file and rename so a SIGINT mid-write
+            # never leaves a truncated .md behind
+            tmp = output_path.with_suffix(".md.tmp")
+            tmp.write_bytes(result.markdown.encode("utf-8"))
+            os.replace(tmp, output_path)
+            cache[entry_name] = {
+                "etag": result.etag,
+                "last_modified": result.last_modified,
+                "sha256": result.sha256,
+            }
             return (url, True, "done")
-        except ScraperError as e:
-            return (url, False, str(e))
-        except Exception as e:
-            return (url, False, f"error: {e}")
+    except ScraperError as e:
+        return (url, False, str(e))
+    except Exception as e:
+        return (url, False, f"error: {e}")
 
 
 async def main():
@@ -83,15 +131,43 @@ async def main():
     # Create output directory
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Check how many already exist
-    existing = sum(1 for url in urls if (OUTPUT_DIR / f"{url.rstrip('/').split('/')[-1]}.md").exists())
-    print(f"Already scraped: {existing}, remaining: {len(urls) - existing}\n")
+    # Derive each entry name once; rsplit avoids building a full list of
+    # path segments just to take the last one
+    entries = [(url, url.rstrip("/").rsplit("/", 1)[-1]) for url in urls]
 
-    # Semaphore for concurrency control
-    semaphore = asyncio.Semaphore(CONCURRENCY)
+    # One directory scan instead of a stat per URL
+    present = frozenset(p.stem for p in OUTPUT_DIR.glob("*.md"))
+    existing = sum(1 for _, entry_name in entries if entry_name in present)
+    print(f"Already scraped: {existing}, remaining: {len(urls) - existing}\n")
 
-    # Create all tasks
-    tasks = [scrape_entry(url, OUTPUT_DIR, semaphore) for url in urls]
+    # Validator cache for conditional refresh requests
+    cache = load_cache()
+
+    # Adaptive concurrency control (AIMD), capped at CONCURRENCY-ish scale
+    limiter = AdaptiveLimiter(initial=CONCURRENCY, min_limit=2, max_limit=64)
+
+    # Bounded producer-consumer queue: keeps live tasks == worker count
+    # instead of materializing ~1700 coroutines up front
+    url_queue: asyncio.Queue = asyncio.Queue(maxsize=CONCURRENCY * 2)
+    result_queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        for entry in entries:
+            await url_queue.put(entry)
+        # One sentinel per worker to shut them down
+        for _ in range(CONCURRENCY):
+            await url_queue.put(None)
+
+    async def work():
+        while True:
+            entry = await url_queue.get()
+            if entry is None:
+                return
+            url, entry_name = entry
+            result = await scrape_entry(
+                url, entry_name, OUTPUT_DIR, limiter, cache, present
+            )
+            result_queue.put_nowait((entry_name, result))
 
     # Track progress
     success_count = 0
@@ -100,20 +176,32 @@ async def main():
     failed_urls = []
 
     # Process with progress reporting
-    for i, coro in enumerate(asyncio.as_completed(tasks), 1):
-        url, success, message = await coro
-        entry_name = url.rstrip("/").split("/")[-1]
-
-        if success:
-            if message == "exists":
-                skip_count += 1
-            else:
-                success_count += 1
-                print(f"[{i}/{len(urls)}] {entry_name}: {message}")
-        else:
-            fail_count += 1
-            failed_urls.append((url, message))
-            print(f"[{i}/{len(urls)}] {entry_name}: FAILED - {message}")
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            for _ in range(CONCURRENCY):
+                tg.create_task(work())
+
+            for i in range(1, len(urls) + 1):
+                entry_name, (url, success, message) = await result_queue.get()
+
+                if success:
+                    if message in ("exists", "unchanged"):
+                        skip_count += 1
+                    else:
+                        success_count += 1
+                        print(f"[{i}/{len(urls)}] {entry_name}: {message}")
+                else:
+                    fail_count += 1
+                    failed_urls.append((entry_name, message))
+                    print(f"[{i}/{len(urls)}] {entry_name}: FAILED - {message}")
+
+                # Observe limiter convergence
+                if i % 50 == 0:
+                    print(f"[{i}/{len(urls)}] concurrency limit: {limiter.limit}")
+    finally:
+        save_cache(cache)
+        await close_client()
 
     # Summary
     print(f"\n{'='*50}")
@@ -122,9 +210,8 @@ async def main():
 
     if failed_urls:
         print(f"\nFailed entries ({len(failed_urls)}):")
-        for url, error in failed_urls[:20]:  # Show first 20
-            entry = url.rstrip("/").split("/")[-1]
-            print(f"  - {entry}: {error}")
+        for entry_name, error in failed_urls[:20]:  # Show first 20
+            print(f"  - {entry_name}: {error}")
         if len(failed_urls) > 20:
             print(f"  ... and {len(failed_urls) - 20} more")
 
@@ -1,5 +1,7 @@
 """Markdown assembler for SEP articles."""
 
+import io
+
 from sep_scraper.metadata import format_frontmatter
 
 
@@ -24,38 +26,40 @@ def assemble_markdown(
     Returns:
         Complete markdown document
     """
-    parts = []
+    # Sections are multi-KB strings already; streaming them into one
+    # buffer avoids the intermediate list plus a document-sized join
+    buf = io.StringIO()
 
     # YAML frontmatter
-    parts.append(format_frontmatter(metadata))
+    buf.write(format_frontmatter(metadata))
 
     # Preamble (intro before first section)
     if preamble:
-        parts.append(preamble)
-        parts.append("")
+        buf.write("\n")
+        buf.write(preamble)
+        buf.write("\n")
 
     # Main content
     if content:
-        parts.append(content)
+        buf.write("\n")
+        buf.write(content)
 
     # Appendices
     if appendices:
         for title, appendix_content in appendices:
-            parts.append("")
-            parts.append(f"## Appendix {title}")
-            parts.append("")
-            parts.append(appendix_content)
+            buf.write("\n\n## Appendix ")
+            buf.write(title)
+            buf.write("\n\n")
+            buf.write(appendix_content)
 
     # Footnotes section
     if footnotes:
-        parts.append("")
-        parts.append("## Notes")
-        parts.append("")
-        parts.append(footnotes)
+        buf.write("\n\n## Notes\n\n")
+        buf.write(footnotes)
 
     # Bibliography
     if bibliography:
-        parts.append("")
-        parts.append(bibliography)
+        buf.write("\n\n")
+        buf.write(bibliography)
 
-    return "\n".join(parts).strip() + "\n"
+    return buf.getvalue().strip() + "\n"
@@ -4,13 +4,14 @@ import argparse
 import asyncio
 import logging
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-
+from sep_scraper.dom import parse_html
 from sep_scraper.fetcher import (
-    fetch_article,
+    close_client,
+    fetch_article_conditional,
     fetch_mathjax_macros,
     fetch_appendices,
     validate_sep_url,
@@ -37,6 +38,23 @@ def extract_entry_name(url: str) -> str:
     return path.split("/")[-1]
 
 
+@dataclass
+class ScrapeResult:
+    """Result of scraping an article, including cache validators.
+
+    Attributes:
+        markdown: Assembled markdown document
+        etag: ETag of the article response, if the server sent one
+        last_modified: Last-Modified of the article response, if sent
+        sha256: Hex digest of the raw article HTML
+    """
+
+    markdown: str
+    etag: str | None = None
+    last_modified: str | None = None
+    sha256: str | None = None
+
+
 async def scrape_article(url: str) -> str:
     """Scrape a SEP article and convert to markdown.
 
@@ -50,44 +68,99 @@ async def scrape_article(url: str) -> str:
         ScraperError: If scraping fails
         ValueError: If URL is invalid
     """
+    result = await scrape_article_result(url)
+    return result.markdown
+
+
+async def scrape_article_result(
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    known_sha: str | None = None,
+) -> ScrapeResult:
+    """Scrape a SEP article, optionally as a conditional request.
+
+    Args:
+        url: SEP article URL
+        etag: ETag from a previous scrape, if any
+        last_modified: Last-Modified from a previous scrape, if any
+        known_sha: SHA-256 digest of the previously scraped article HTML
+
+    Returns:
+        ScrapeResult with markdown and response cache validators
+
+    Raises:
+        NotModified: If the article is unchanged since the previous scrape
+        ScraperError: If scraping fails
+        ValueError: If URL is invalid
+    """
     # Validate URL
     validate_sep_url(url)
 
     # Fetch HTML and macros concurrently
-    html, macros = await asyncio.gather(
-        fetch_article(url),
+    fetched, macros = await asyncio.gather(
+        fetch_article_conditional(
+            url, etag=etag, last_modified=last_modified, known_sha=known_sha
+        ),
         fetch_mathjax_macros(url),
     )
+    html = fetched.text
 
     # Parse main article
-    soup = BeautifulSoup(html, "lxml")
+    soup = parse_html(html)
     parser = SEPParser(soup, url, macros)
 
-    # Extract appendix links and fetch appendices
-    appendix_links = parser.get_appendix_links()
-    appendix_pages = await fetch_appendices(appendix_links)
-
-    # Parse each appendix
-    appendices = []
-    for title, appendix_html in appendix_pages:
-        appendix_soup = BeautifulSoup(appendix_html, "lxml")
-        appendix_content = parser.parse_appendix(appendix_soup)
-        if appendix_content:
-            appendices.append((title, appendix_content))
-
-    # Extract other components
-    metadata = parser.get_metadata()
-    preamble = parser.get_preamble()
-    content = parser.get_main_content()
-    footnotes = parser.get_footnotes()
-    bibliography = parser.get_bibliography()
+    # Extract all components in one pass
+    parsed = parser.extract_all()
+
+    # Fetch appendices, then parse them off the event loop so other
+    # articles' network I/O keeps flowing during the CPU-bound parses
+    appendix_pages = await fetch_appendices(parsed.appendix_links)
+
+    def parse_one(title: str, appendix_html: str) -> tuple[str, str]:
+        return (title, parser.parse_appendix(parse_html(appendix_html)))
+
+    loop = asyncio.get_running_loop()
+    parsed_pages = await asyncio.gather(
+        *(
+            loop.run_in_executor(None, parse_one, title, appendix_html)
+            for title, appendix_html in appendix_pages
+        )
+    )
+    appendices = [(title, content) for title, content in parsed_pages if content]
 
     # Assemble with appendices and preamble
-    return assemble_markdown(
-        metadata, content, footnotes, bibliography, appendices, preamble
+    markdown = assemble_markdown(
+        parsed.metadata,
+        parsed.content,
+        parsed.footnotes,
+        parsed.bibliography,
+        appendices,
+        parsed.preamble,
+    )
+    return ScrapeResult(
+        markdown=markdown,
+        etag=fetched.etag,
+        last_modified=fetched.last_modified,
+        sha256=fetched.sha256,
     )
 
 
+async def _scrape_and_close(url: str) -> str:
+    """Scrape one article, closing the shared client before loop teardown.
+
+    Args:
+        url: SEP article URL
+
+    Returns:
+        Markdown string
+    """
+    try:
+        return await scrape_article(url)
+    finally:
+        await close_client()
+
+
 def main() -> None:
     """Main entry point for CLI."""
     parser = argparse.ArgumentParser(
@@ -131,7 +204,7 @@ def main() -> None:
 
     # Run scraper
     try:
-        markdown = asyncio.run(scrape_article(args.url))
+        markdown = asyncio.run(_scrape_and_close(args.url))
     except ScraperError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import io
 
-from sep_scraper.converters.text import TextConverter
+from bs4 import Tag
 
-if TYPE_CHECKING:
-    from bs4 import Tag
+from sep_scraper.converters.text import TextConverter
 
 
 class BibliographyConverter:
@@ -25,66 +24,55 @@ class BibliographyConverter:
         Returns:
             Markdown string with heading and entries
         """
-        lines = []
+        buf = io.StringIO()
 
         for element in section.children:
-            if not hasattr(element, "name"):
+            if not isinstance(element, Tag):
                 continue
 
-            if element.name == "h2":
-                heading_text = element.get_text(strip=True)
-                lines.append(f"## {heading_text}")
-                lines.append("")
-            elif element.name == "h3":
-                heading_text = element.get_text(strip=True)
-                lines.append(f"### {heading_text}")
-                lines.append("")
-            elif element.name == "h4":
-                heading_text = element.get_text(strip=True)
-                lines.append(f"#### {heading_text}")
-                lines.append("")
+            if element.name in ("h2", "h3", "h4"):
+                prefix = "#" * int(element.name[1])
+                buf.write(f"{prefix} {element.get_text(strip=True)}\n\n")
             elif element.name == "ul":
-                list_md = self._convert_list(element, depth=0)
-                lines.append(list_md)
-                lines.append("")
+                self._write_list(element, depth=0, buf=buf)
+                buf.write("\n")
             elif element.name == "p":
                 entry = self._text_converter.convert_inline(element)
                 if entry:
-                    lines.append(entry)
-                    lines.append("")
+                    buf.write(entry)
+                    buf.write("\n\n")
 
-        return "\n".join(lines).rstrip()
+        return buf.getvalue().rstrip()
 
-    def _convert_list(self, ul: Tag, depth: int) -> str:
-        """Convert a ul element to markdown list with proper nesting.
+    def _write_list(self, ul: Tag, depth: int, buf: io.StringIO) -> None:
+        """Write a ul element as a markdown list with proper nesting.
+
+        Entries stream into the shared buffer so nested recursion doesn't
+        allocate and re-join intermediate lists.
 
         Args:
             ul: The ul element to convert
             depth: Current nesting depth for indentation
-
-        Returns:
-            Markdown list string
+            buf: Output buffer shared across the recursion
         """
-        lines = []
         indent = "  " * depth
 
         for li in ul.find_all("li", recursive=False):
-            # Extract nested ul if present (temporarily remove for inline conversion)
-            nested_ul = li.find("ul", recursive=False)
-            if nested_ul:
-                nested_ul.extract()
-
-            # Convert the li content using TextConverter (handles em, strong, a, etc.)
-            text = self._text_converter.convert_inline(li)
+            # Convert the li content without the nested ul; skipping it during
+            # iteration avoids extract()'s tree surgery on the shared soup
+            nested_ul = next(
+                (c for c in li.children if isinstance(c, Tag) and c.name == "ul"),
+                None,
+            )
+            text = self._text_converter.convert_inline_nodes(
+                c for c in li.children if c is not nested_ul
+            )
             # Normalize whitespace
             text = " ".join(text.split())
 
             if text:
-                lines.append(f"{indent}- {text}")
+                buf.write(f"{indent}- {text}\n")
 
             # Recurse for nested list
             if nested_ul:
-                nested_md = self._convert_list(nested_ul, depth + 1)
-                lines.append(nested_md)
-
-        return "\n".join(lines)
+                self._write_list(nested_ul, depth + 1, buf)
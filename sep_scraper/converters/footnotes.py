@@ -11,6 +11,14 @@ if TYPE_CHECKING:
     from bs4 import BeautifulSoup, Tag
 
 
+# Compiled once: these run per document and per footnote, and per-call
+# re.compile/cache probes add up on articles with 100+ notes
+_NOTE_ID_RE = re.compile(r"note", re.I)
+_NOTE_OR_FN_ID_RE = re.compile(r"note|fn", re.I)
+_NOTES_HEADING_RE = re.compile(r"^notes?$", re.I)
+_DIGITS_RE = re.compile(r"\d+")
+
+
 class FootnoteConverter:
     """Extract and convert footnotes from SEP articles."""
 
@@ -31,12 +39,12 @@ class FootnoteConverter:
         notes_section = None
 
         # Try finding by ID
-        notes_section = self._soup.find("div", id=re.compile(r"note", re.I))
+        notes_section = self._soup.find("div", id=_NOTE_ID_RE)
 
         # Try finding by heading
         if not notes_section:
             for heading in self._soup.find_all(["h2", "h3", "h4"]):
-                if re.search(r"^notes?$", heading.get_text(strip=True), re.I):
+                if _NOTES_HEADING_RE.search(heading.get_text(strip=True)):
                     notes_section = heading.parent
                     break
 
@@ -44,14 +52,14 @@ class FootnoteConverter:
             return
 
         # Extract each footnote
-        for elem in notes_section.find_all(["p", "li"], id=re.compile(r"note|fn")):
+        for elem in notes_section.find_all(["p", "li"], id=_NOTE_OR_FN_ID_RE):
             note_id = elem.get("id", "")
             # Extract number from ID
-            match = re.search(r"(\d+)", note_id)
+            match = _DIGITS_RE.search(note_id)
             if not match:
                 continue
 
-            num = match.group(1)
+            num = match.group(0)
 
             # Get content, excluding back-reference link
             content_parts = []
@@ -115,10 +123,10 @@ class FootnoteConverter:
         href = anchor.get("href", "")
 
         # Extract number from href or text
-        if match := re.search(r"(\d+)", href):
-            num = match.group(1)
-        elif match := re.search(r"(\d+)", anchor.get_text()):
-            num = match.group(1)
+        if match := _DIGITS_RE.search(href):
+            num = match.group(0)
+        elif match := _DIGITS_RE.search(anchor.get_text()):
+            num = match.group(0)
         else:
             return element.get_text(strip=True)
 
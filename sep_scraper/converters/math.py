@@ -9,6 +9,30 @@ if TYPE_CHECKING:
     from bs4 import Tag
 
 
+# Display math, inline math, eqref, and mbox rewrites fused into one
+# alternation so the delimiter-conversion stage traverses the text once
+_CONVERT_TEXT_RE = re.compile(
+    r"\\\[(?P<disp>.*?)\\\]"
+    r"|\\\((?P<inl>.*?)\\\)"
+    r"|\\eqref\{(?P<eqref>[^}]+)\}"
+    r"|(?P<mbox>\\mbox\{)",
+    re.DOTALL,
+)
+_EQREF_RE = re.compile(r"\\eqref\{([^}]+)\}")
+_MBOX_RE = re.compile(r"\\mbox\{")
+_DISPLAY_BLOCK_RE = re.compile(r"^[ \t]*\$\$(.*?)\$\$", re.DOTALL | re.MULTILINE)
+_INLINE_BLOCK_RE = re.compile(
+    r"(?<!\$)\$(?!\$)((?:[^$]|\\\$)+?)(?<!\$)\$(?!\$)", re.DOTALL
+)
+_WS_RE = re.compile(r"\s+")
+_MATHTEX_TYPE_RE = re.compile(r"math/tex")
+# Candidate macro starts: backslash followed by an identifier. Greedy
+# letter matching means \phii never half-matches a defined \phi
+_MACRO_START_RE = re.compile(r"\\([A-Za-z]+)")
+# Argument references (#1, #2, ...) in macro expansion templates
+_ARG_REF_RE = re.compile(r"#(\d+)")
+
+
 class MathConverter:
     """Convert MathJax/LaTeX elements to Markdown math syntax."""
 
@@ -20,6 +44,19 @@ class MathConverter:
         """
         self._macros = macros or {}
 
+        # Substring needles let expansion skip macros that plainly don't
+        # occur: a C-level `in` scan is far cheaper than a regex search
+        self._macro_needles = {name: "\\" + name for name in self._macros}
+
+        # Expansion templates split once on #N references, alternating
+        # [literal, arg-index, literal, ...], so substitution is a single
+        # join instead of one .replace scan per argument
+        self._macro_templates = {
+            name: _ARG_REF_RE.split(expansion)
+            for name, (expansion, num_args) in self._macros.items()
+            if num_args > 0
+        }
+
     def _extract_brace_arg(self, text: str, start: int) -> tuple[str, int] | None:
         """Extract a brace-delimited argument from text, handling nesting.
 
@@ -33,117 +70,122 @@ class MathConverter:
         if start >= len(text) or text[start] != "{":
             return None
 
+        # Jump between braces and escapes with str.find (a C-level scan)
+        # rather than stepping one character at a time in bytecode
         depth = 1
         pos = start + 1
-        while pos < len(text) and depth > 0:
-            if text[pos] == "{":
+        while depth > 0:
+            candidates = [
+                i
+                for i in (
+                    text.find("{", pos),
+                    text.find("}", pos),
+                    text.find("\\", pos),
+                )
+                if i != -1
+            ]
+            if not candidates:
+                return None
+            pos = min(candidates)
+            ch = text[pos]
+            if ch == "{":
                 depth += 1
-            elif text[pos] == "}":
+                pos += 1
+            elif ch == "}":
                 depth -= 1
-            elif text[pos] == "\\" and pos + 1 < len(text):
-                # Skip escaped character
                 pos += 1
-            pos += 1
-
-        if depth != 0:
-            return None
+            else:
+                # Skip escaped character
+                pos += 2
 
         # Extract content between braces
         content = text[start + 1 : pos - 1]
         return (content, pos)
 
-    def _expand_macros(self, latex: str) -> str:
+    def _expand_macros(self, latex: str, depth: int = 0) -> str:
         """Expand custom macros in LaTeX string.
 
+        A single left-to-right scan replaces each defined macro as it is
+        found; expansion output is expanded recursively (bounded by
+        `depth`) so macros that expand to other macros resolve without
+        rescanning the whole string per pass.
+
         Args:
             latex: LaTeX string with potential custom macros
+            depth: Current recursion depth, to stop runaway expansion
 
         Returns:
             LaTeX string with macros expanded
         """
-        if not self._macros:
+        if not self._macros or depth >= 5:
             return latex
 
-        result = latex
-        # Expand macros - may need multiple passes for nested macros
-        for _ in range(5):  # Max 5 passes for nested expansion
-            changed = False
-            for name, (expansion, num_args) in self._macros.items():
-                if num_args == 0:
-                    # Simple replacement: \macroname -> expansion
-                    pattern = re.escape("\\") + name + r"(?![a-zA-Z])"
-                    new_result = re.sub(pattern, lambda m: expansion, result)
-                    if new_result != result:
-                        changed = True
-                        result = new_result
-                else:
-                    # Macro with arguments: \macroname{arg1}{arg2}...
-                    # Need to find and replace each occurrence manually
-                    new_result = self._expand_macro_with_args(
-                        result, name, expansion, num_args
-                    )
-                    if new_result != result:
-                        changed = True
-                        result = new_result
-            if not changed:
-                break
-
-        return result
-
-    def _expand_macro_with_args(
-        self, text: str, name: str, expansion: str, num_args: int
-    ) -> str:
-        """Expand a single macro with arguments throughout the text.
+        # No backslash means no macros to expand
+        if "\\" not in latex:
+            return latex
 
-        Args:
-            text: Text to process
-            name: Macro name (without backslash)
-            expansion: Expansion template with #1, #2, etc.
-            num_args: Number of arguments expected
+        # Skip the scan entirely when no defined macro name occurs
+        if not any(needle in latex for needle in self._macro_needles.values()):
+            return latex
 
-        Returns:
-            Text with macro expanded
-        """
         result = []
         pos = 0
-        pattern = re.compile(re.escape("\\") + name + r"(?![a-zA-Z])")
-
-        while pos < len(text):
-            match = pattern.search(text, pos)
+        while True:
+            match = _MACRO_START_RE.search(latex, pos)
             if not match:
-                result.append(text[pos:])
+                result.append(latex[pos:])
                 break
 
-            # Add text before the match
-            result.append(text[pos : match.start()])
+            macro = self._macros.get(match.group(1))
+            if macro is None:
+                result.append(latex[pos : match.end()])
+                pos = match.end()
+                continue
 
-            # Try to extract arguments
+            expansion, num_args = macro
+            result.append(latex[pos : match.start()])
+
+            if num_args == 0:
+                result.append(self._expand_macros(expansion, depth + 1))
+                pos = match.end()
+                continue
+
+            # Macro with arguments: \macroname{arg1}{arg2}...
             arg_pos = match.end()
             args = []
             success = True
-
             for _ in range(num_args):
                 # Skip whitespace before argument
-                while arg_pos < len(text) and text[arg_pos] in " \t\n":
+                while arg_pos < len(latex) and latex[arg_pos] in " \t\n":
                     arg_pos += 1
-
-                extracted = self._extract_brace_arg(text, arg_pos)
+                extracted = self._extract_brace_arg(latex, arg_pos)
                 if extracted is None:
                     success = False
                     break
                 arg_content, arg_pos = extracted
                 args.append(arg_content)
 
-            if success and len(args) == num_args:
-                # Substitute arguments into expansion
-                expanded = expansion
-                for i, arg in enumerate(args, 1):
-                    expanded = expanded.replace(f"#{i}", arg)
-                result.append(expanded)
+            if success:
+                # Substitute arguments into the template, then expand the result
+                template = self._macro_templates[match.group(1)]
+                expanded = "".join(
+                    part
+                    if i % 2 == 0
+                    # References outside 1..len(args) stay literal, as
+                    # .replace did; without the lower bound #0 would
+                    # index args[-1]
+                    else (
+                        args[int(part) - 1]
+                        if 1 <= int(part) <= len(args)
+                        else "#" + part
+                    )
+                    for i, part in enumerate(template)
+                )
+                result.append(self._expand_macros(expanded, depth + 1))
                 pos = arg_pos
             else:
                 # Couldn't extract args, keep original and move past macro name
-                result.append(text[match.start() : match.end()])
+                result.append(latex[match.start() : match.end()])
                 pos = match.end()
 
         return "".join(result)
@@ -160,7 +202,9 @@ class MathConverter:
         Returns:
             Text with eqref converted to parenthesized format
         """
-        return re.sub(r"\\eqref\{([^}]+)\}", r"(\1)", text)
+        if "\\eqref" not in text:
+            return text
+        return _EQREF_RE.sub(r"(\1)", text)
 
     def _convert_mbox(self, text: str) -> str:
         """Convert \\mbox{...} to \\text{...} for KaTeX compatibility.
@@ -173,7 +217,9 @@ class MathConverter:
         Returns:
             Text with mbox converted to text
         """
-        return re.sub(r"\\mbox\{", r"\\text{", text)
+        if "\\mbox{" not in text:
+            return text
+        return _MBOX_RE.sub(r"\\text{", text)
 
     def _normalize_display_math(self, text: str) -> str:
         """Normalize display math blocks for KaTeX compatibility.
@@ -188,6 +234,9 @@ class MathConverter:
             Text with normalized display math
         """
 
+        if "$$" not in text:
+            return text
+
         def normalize_block(match: re.Match) -> str:
             content = match.group(1)
             # Normalize internal whitespace while preserving structure
@@ -200,12 +249,7 @@ class MathConverter:
 
         # Match display math blocks, including any leading whitespace on the line
         # This ensures $$ starts at the beginning of a line
-        return re.sub(
-            r"^[ \t]*\$\$(.*?)\$\$",
-            normalize_block,
-            text,
-            flags=re.DOTALL | re.MULTILINE,
-        )
+        return _DISPLAY_BLOCK_RE.sub(normalize_block, text)
 
     def _normalize_inline_math(self, text: str) -> str:
         """Normalize inline math blocks to single lines.
@@ -220,20 +264,18 @@ class MathConverter:
             Text with inline math normalized to single lines
         """
 
+        if "$" not in text:
+            return text
+
         def normalize_match(match: re.Match) -> str:
             content = match.group(1)
             # Replace newlines and collapse whitespace
-            content = re.sub(r"\s+", " ", content)
+            content = _WS_RE.sub(" ", content)
             return f"${content}$"
 
         # Match inline math (single $, not $$)
         # Use negative lookbehind/lookahead to avoid matching $$
-        return re.sub(
-            r"(?<!\$)\$(?!\$)((?:[^$]|\\\$)+?)(?<!\$)\$(?!\$)",
-            normalize_match,
-            text,
-            flags=re.DOTALL,
-        )
+        return _INLINE_BLOCK_RE.sub(normalize_match, text)
 
     def convert(self, element: Tag) -> str:
         """Convert a MathJax script tag to Markdown math.
@@ -278,35 +320,33 @@ class MathConverter:
         Returns:
             Text with Markdown math delimiters and expanded macros
         """
-        # Convert display math \[...\] to $$...$$ with macro expansion
-        def expand_display(match):
-            latex = self._expand_macros(match.group(1))
-            return f"$${latex}$$"
-
-        text = re.sub(
-            r"\\\[(.*?)\\\]",
-            expand_display,
-            text,
-            flags=re.DOTALL,
-        )
-
-        # Convert inline math \(...\) to $...$ with macro expansion
-        def expand_inline(match):
-            latex = self._expand_macros(match.group(1))
-            return f"${latex}$"
-
-        text = re.sub(
-            r"\\\((.*?)\\\)",
-            expand_inline,
-            text,
-            flags=re.DOTALL,
-        )
-
-        # Convert \eqref{X} to (X) for KaTeX compatibility
-        text = self._convert_eqref(text)
-
-        # Convert \mbox{} to \text{} for KaTeX compatibility
-        text = self._convert_mbox(text)
+        # Convert display \[...\] and inline \(...\) math to $-delimited
+        # form, rewrite \eqref{X} to (X) and \mbox{ to \text{ for KaTeX,
+        # all in a single scan. The substring probes skip the regex engine
+        # entirely for the common case of prose with no LaTeX at all.
+        if "\\" in text and (
+            "\\[" in text
+            or "\\(" in text
+            or "\\eqref" in text
+            or "\\mbox{" in text
+        ):
+
+            def rewrite(match):
+                kind = match.lastgroup
+                if kind == "eqref":
+                    return f"({match.group('eqref')})"
+                if kind == "mbox":
+                    return "\\text{"
+                latex = self._expand_macros(match.group(kind))
+                # eqref/mbox inside the math body were consumed by this
+                # match, so rewrite them here too
+                latex = self._convert_eqref(latex)
+                latex = self._convert_mbox(latex)
+                if kind == "disp":
+                    return f"$${latex}$$"
+                return f"${latex}$"
+
+            text = _CONVERT_TEXT_RE.sub(rewrite, text)
 
         # Normalize display math (remove indentation, consolidate lines)
         text = self._normalize_display_math(text)
@@ -326,7 +366,7 @@ class MathConverter:
             LaTeX string or None if not a math span
         """
         # Check for script tag inside
-        if script := element.find("script", type=re.compile(r"math/tex")):
+        if script := element.find("script", type=_MATHTEX_TYPE_RE):
             return self.convert(script)
 
         # Check for data-latex attribute
@@ -11,6 +11,11 @@ if TYPE_CHECKING:
     from bs4 import Tag
 
 
+# Fold line breaks to spaces and escape pipes in one C-level translate pass
+_CELL_TRANSLATE = str.maketrans({"\n": " ", "\r": " ", "\t": " ", "|": r"\|"})
+_WS_COLLAPSE_RE = re.compile(r" {2,}")
+
+
 class TableConverter:
     """Convert HTML tables to Markdown tables."""
 
@@ -28,14 +33,16 @@ class TableConverter:
         """
         rows = []
         header_row = None
-        body_rows = []
+
+        # One tr scan shared by header detection and body collection
+        all_rows = table.find_all("tr")
 
         # Find header row
         if thead := table.find("thead"):
             header_row = thead.find("tr")
         else:
             # First row with th cells is the header
-            for tr in table.find_all("tr"):
+            for tr in all_rows:
                 if tr.find("th"):
                     header_row = tr
                     break
@@ -45,9 +52,7 @@ class TableConverter:
             body_rows = tbody.find_all("tr")
         else:
             # All rows except header
-            for tr in table.find_all("tr"):
-                if tr != header_row:
-                    body_rows.append(tr)
+            body_rows = [tr for tr in all_rows if tr is not header_row]
 
         # Convert header
         if header_row:
@@ -82,13 +87,10 @@ class TableConverter:
         # Convert inner content
         content = self._text_converter.convert_inline(cell)
 
-        # Replace line breaks with space
-        content = re.sub(r"\n+", " ", content)
-
-        # Escape pipe characters
-        content = content.replace("|", r"\|")
+        # Fold line breaks to spaces and escape pipe characters
+        content = content.translate(_CELL_TRANSLATE)
 
-        # Normalize whitespace
-        content = re.sub(r"\s+", " ", content).strip()
+        # Collapse runs of spaces
+        content = _WS_COLLAPSE_RE.sub(" ", content).strip()
 
         return content
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from bs4 import Tag
+from bs4 import Comment, Tag
+
+_WS_RE = re.compile(r"\s+")
 
 
 class TextConverter:
@@ -49,47 +49,134 @@ class TextConverter:
 
     def convert_inline(self, element: Tag) -> str:
         """Convert inline content to Markdown."""
-        result = []
+        # Elements with no child tags (most paragraphs) need no per-child
+        # dispatch: one C-level get_text plus whitespace normalization
+        if element.find(True, recursive=False) is None:
+            return _WS_RE.sub(" ", element.get_text()).strip()
+        return self.convert_inline_nodes(element.children)
 
-        for child in element.children:
+    def convert_inline_nodes(self, nodes) -> str:
+        """Convert an iterable of sibling nodes to inline Markdown.
+
+        Args:
+            nodes: Iterable of Tags and NavigableStrings
+
+        Returns:
+            Markdown string
+        """
+        out: list[str] = []
+        self._write_inline_nodes(nodes, out)
+        return "".join(out).strip()
+
+    def _write_inline_nodes(self, nodes, out: list[str]) -> None:
+        """Append inline Markdown for `nodes` to a shared output list.
+
+        The recursion streams pieces into one list so nested markup
+        doesn't join-and-rejoin an intermediate string per level.
+
+        Args:
+            nodes: Iterable of Tags and NavigableStrings
+            out: Output pieces, joined once by the caller
+        """
+        for child in nodes:
             if isinstance(child, str):
+                # Comments subclass str but get_text() skips them; filter
+                # here so both inline paths agree
+                if isinstance(child, Comment):
+                    continue
                 # Normalize whitespace
-                text = re.sub(r"\s+", " ", child)
-                result.append(text)
+                out.append(_WS_RE.sub(" ", child))
             elif child.name == "em" or child.name == "i":
-                inner = self.convert_inline(child)
-                result.append(f"*{inner}*")
+                out.append("*")
+                self._write_stripped(child, out)
+                out.append("*")
             elif child.name == "strong" or child.name == "b":
-                inner = self.convert_inline(child)
-                result.append(f"**{inner}**")
+                out.append("**")
+                self._write_stripped(child, out)
+                out.append("**")
             elif child.name == "a":
-                text = self.convert_inline(child)
                 href = child.get("href", "")
                 # Skip creating links for anchors that only have id/name (no href)
                 if href:
-                    result.append(f"[{text}]({href})")
+                    out.append("[")
+                    self._write_stripped(child, out)
+                    out.append(f"]({href})")
                 else:
-                    result.append(text)
+                    self._write_stripped(child, out)
             elif child.name == "sup":
                 # Handle superscript (often footnotes)
-                inner = self.convert_inline(child)
-                result.append(inner)
+                self._write_stripped(child, out)
             elif child.name == "sub":
-                inner = self.convert_inline(child)
-                result.append(inner)
+                self._write_stripped(child, out)
             elif child.name == "br":
-                result.append("\n")
+                out.append("\n")
             elif child.name == "code":
-                inner = child.get_text()
-                result.append(f"`{inner}`")
+                out.append(f"`{child.get_text()}`")
             elif hasattr(child, "children"):
-                result.append(self.convert_inline(child))
+                self._write_stripped(child, out)
 
-        return "".join(result).strip()
+    def _write_stripped(self, element: Tag, out: list[str]) -> None:
+        """Write an element's inline content, stripped at its edges.
+
+        Args:
+            element: Element whose children to convert
+            out: Shared output list
+        """
+        if element.find(True, recursive=False) is None:
+            text = _WS_RE.sub(" ", element.get_text()).strip()
+            if text:
+                out.append(text)
+            return
+        mark = len(out)
+        self._write_inline_nodes(element.children, out)
+        self._strip_in_place(out, mark)
+
+    @staticmethod
+    def _strip_in_place(out: list[str], mark: int) -> None:
+        """Strip edge whitespace from the pieces written since `mark`.
+
+        Args:
+            out: Shared output list
+            mark: Index where the current element's pieces begin
+        """
+        end = len(out)
+        while end > mark:
+            stripped = out[end - 1].rstrip()
+            if stripped:
+                out[end - 1] = stripped
+                break
+            end -= 1
+        del out[end:]
+
+        start = mark
+        while start < len(out):
+            stripped = out[start].lstrip()
+            if stripped:
+                out[start] = stripped
+                break
+            start += 1
+        del out[mark:start]
 
     def _convert_list(self, element: Tag, ordered: bool, depth: int = 0) -> str:
         """Convert list element to Markdown."""
-        lines = []
+        lines: list[str] = []
+        self._write_list(element, ordered, depth, lines)
+        return "\n".join(lines)
+
+    def _write_list(
+        self, element: Tag, ordered: bool, depth: int, out: list[str]
+    ) -> None:
+        """Append a list element's Markdown lines to a shared buffer.
+
+        Nested lists recurse into the same buffer, so the whole tree is
+        joined once by _convert_list instead of once per nesting level.
+
+        Args:
+            element: ul or ol element
+            ordered: Whether to emit numbered items
+            depth: Current nesting depth for indentation
+            out: Output lines, joined by the caller
+        """
         indent = "  " * depth
         counter = 1
 
@@ -99,35 +186,34 @@ class TextConverter:
             nested_list = None
 
             for child in li.children:
-                if hasattr(child, "name") and child.name in ("ul", "ol"):
-                    nested_list = child
+                if isinstance(child, Tag):
+                    if child.name in ("ul", "ol"):
+                        nested_list = child
+                    else:
+                        text_parts.append(self.convert_inline(child))
                 elif isinstance(child, str):
                     text_parts.append(child.strip())
-                elif hasattr(child, "name"):
-                    text_parts.append(self.convert_inline(child))
 
             text = " ".join(filter(None, text_parts))
 
             if ordered:
-                lines.append(f"{indent}{counter}. {text}")
+                out.append(f"{indent}{counter}. {text}")
                 counter += 1
             else:
-                lines.append(f"{indent}- {text}")
+                out.append(f"{indent}- {text}")
 
             # Handle nested list
             if nested_list:
-                nested_ordered = nested_list.name == "ol"
-                nested_content = self._convert_list(nested_list, nested_ordered, depth + 1)
-                lines.append(nested_content)
-
-        return "\n".join(lines)
+                self._write_list(
+                    nested_list, nested_list.name == "ol", depth + 1, out
+                )
 
     def _convert_blockquote(self, element: Tag) -> str:
         """Convert blockquote element to Markdown."""
         lines = []
 
         for child in element.children:
-            if hasattr(child, "name") and child.name == "p":
+            if isinstance(child, Tag) and child.name == "p":
                 text = self.convert_inline(child)
                 lines.append(f"> {text}")
             elif isinstance(child, str) and child.strip():
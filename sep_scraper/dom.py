@@ -0,0 +1,30 @@
+"""HTML parsing entry point for SEP scraper.
+
+All article and appendix HTML goes through :func:`parse_html` so the parser
+backend is chosen in exactly one place. The default backend is BeautifulSoup
+over lxml's C parser; a faster pure-C backend (e.g. selectolax/Lexbor) can be
+slotted in here later, but the current converters rely on tree mutation
+(tag renaming in ``parse_appendix``, ``decompose``/``extract``) that only the
+BeautifulSoup node API supports.
+"""
+
+from bs4 import BeautifulSoup
+
+# Parser backend passed to BeautifulSoup for every parse in the pipeline.
+BS_PARSER = "lxml"
+
+
+def parse_html(html: str | bytes, encoding: str | None = None) -> BeautifulSoup:
+    """Parse HTML into a document tree.
+
+    Args:
+        html: Raw HTML content
+        encoding: Known encoding of `html` when it is bytes; passing it
+            skips BeautifulSoup's encoding-detection pass
+
+    Returns:
+        Parsed BeautifulSoup document
+    """
+    if encoding is not None:
+        return BeautifulSoup(html, BS_PARSER, from_encoding=encoding)
+    return BeautifulSoup(html, BS_PARSER)
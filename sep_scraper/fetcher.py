@@ -1,14 +1,64 @@
 """HTTP fetching utilities for SEP scraper."""
 
 import asyncio
+import functools
+import hashlib
+import json
 import logging
-import re
-from urllib.parse import urlparse, urljoin
+import os
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for bulk scraping
+POOL_CONNECTIONS = 20
+
+# Attempts per article when the server throttles (429/503)
+MAX_FETCH_ATTEMPTS = 5
+
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    A single pooled client with HTTP/2 and keep-alive amortizes TCP/TLS
+    handshakes across every article, appendix, and macro fetch.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=POOL_CONNECTIONS,
+                max_connections=POOL_CONNECTIONS * 2,
+                keepalive_expiry=60,
+            ),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            # Brotli roughly quarters bytes-on-wire for SEP's HTML
+            headers={"Accept-Encoding": "br, gzip"},
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
 
 class ScraperError(Exception):
     """Raised when scraping fails."""
@@ -16,40 +66,153 @@ class ScraperError(Exception):
     pass
 
 
+class NotModified(ScraperError):
+    """Raised when a conditional request returns HTTP 304."""
+
+    pass
+
+
+@dataclass
+class FetchResult:
+    """Result of an article fetch, including cache validators.
+
+    Attributes:
+        text: HTML content
+        etag: ETag response header, if the server sent one
+        last_modified: Last-Modified response header, if sent
+        sha256: Hex digest of the raw response body
+    """
+
+    text: str
+    etag: str | None = None
+    last_modified: str | None = None
+    sha256: str | None = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _local_js_url(article_url: str) -> str:
+    """Derive the local.js URL for an article.
+
+    Article URLs are already validated absolute paths, so a string
+    concat replaces urljoin's full reparse; memoizing keeps repeat
+    derivations for the same entry to a dict hit.
+
+    Args:
+        article_url: SEP article URL
+
+    Returns:
+        Full URL to the entry's local.js
+    """
+    return article_url.rstrip("/") + "/local.js"
+
+
+# Completed fetches are cached as tasks so concurrent callers for the
+# same local.js share one request and later callers return instantly
+_MACRO_CACHE: dict[str, asyncio.Task] = {}
+
+
 async def fetch_mathjax_macros(article_url: str) -> dict[str, tuple[str, int]]:
     """Fetch custom MathJax macros from article's local.js file.
 
+    Results are cached per local.js URL for the lifetime of the process.
+    (local.js is served per entry, so the cache is keyed by URL rather
+    than by host.)
+
     Args:
         article_url: SEP article URL
 
     Returns:
         Dictionary mapping macro names to (expansion, num_args) tuples
     """
-    # Construct local.js URL
-    if not article_url.endswith("/"):
-        article_url += "/"
-    local_js_url = urljoin(article_url, "local.js")
+    local_js_url = _local_js_url(article_url)
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.get(local_js_url, follow_redirects=True)
-            if response.status_code != 200:
-                return {}
-            return _parse_mathjax_macros(response.text)
-        except httpx.RequestError:
+    task = _MACRO_CACHE.get(local_js_url)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_mathjax_macros_impl(local_js_url))
+        _MACRO_CACHE[local_js_url] = task
+
+    try:
+        return await task
+    except Exception:
+        # Don't cache failures
+        _MACRO_CACHE.pop(local_js_url, None)
+        raise
+
+
+async def _fetch_mathjax_macros_impl(local_js_url: str) -> dict[str, tuple[str, int]]:
+    """Fetch and parse a local.js file.
+
+    Args:
+        local_js_url: Full URL to the local.js file
+
+    Returns:
+        Dictionary mapping macro names to (expansion, num_args) tuples
+    """
+    try:
+        response = await get_client().get(local_js_url, timeout=10.0)
+        if response.status_code != 200:
             return {}
+        return _parse_mathjax_macros(response.text)
+    except httpx.RequestError:
+        return {}
+
+
+def _read_js_string(text: str, pos: int) -> tuple[str | None, int]:
+    """Read a quoted JavaScript string literal starting at `pos`.
+
+    Args:
+        text: Source text
+        pos: Index of the opening quote
+
+    Returns:
+        Tuple of (raw contents with escapes intact, index past the
+        closing quote), or (None, len(text)) if the string is unterminated
+    """
+    quote = text[pos]
+    pos += 1
+    out = []
+    n = len(text)
+    while pos < n:
+        ch = text[pos]
+        if ch == "\\" and pos + 1 < n:
+            out.append(ch)
+            out.append(text[pos + 1])
+            pos += 2
+            continue
+        if ch == quote:
+            return "".join(out), pos + 1
+        out.append(ch)
+        pos += 1
+    return None, n
+
+
+def _decode_js_escapes(value: str) -> str:
+    """Decode JavaScript escape sequences."""
+    value = value.replace("\\\\", "\x00")  # Temp placeholder
+    value = value.replace("\\", "")  # Remove single escapes
+    value = value.replace("\x00", "\\")  # Restore double as single
+    return value
+
+
+_JS_WS = " \t\r\n"
 
 
 def _parse_mathjax_macros(js_content: str) -> dict[str, tuple[str, int]]:
     """Parse MathJax macro definitions from local.js content.
 
+    The Macros section is walked once: identifier, colon, then either a
+    quoted scalar (`name: "expansion"`) or an array form
+    (`name: ["expansion", numArgs]`). String literals are consumed
+    atomically, so identifiers inside expansion text can never be
+    mistaken for keys.
+
     Args:
         js_content: JavaScript content from local.js
 
     Returns:
         Dictionary mapping macro names to (expansion, num_args) tuples
     """
-    macros = {}
+    macros: dict[str, tuple[str, int]] = {}
 
     # Find the Macros section - use balanced brace matching
     macros_start = js_content.find("Macros")
@@ -61,55 +224,97 @@ def _parse_mathjax_macros(js_content: str) -> dict[str, tuple[str, int]]:
     if brace_start == -1:
         return macros
 
-    # Find matching closing brace (handle nested braces)
+    # Find matching closing brace (handle nested braces), jumping
+    # between braces with str.find instead of stepping per character
     depth = 1
     pos = brace_start + 1
-    while pos < len(js_content) and depth > 0:
-        if js_content[pos] == "{":
+    while depth > 0:
+        opening = js_content.find("{", pos)
+        closing = js_content.find("}", pos)
+        if closing == -1:
+            pos = len(js_content)
+            break
+        if opening != -1 and opening < closing:
             depth += 1
-        elif js_content[pos] == "}":
+            pos = opening + 1
+        else:
             depth -= 1
+            pos = closing + 1
+
+    section = js_content[brace_start + 1 : pos - 1]
+    n = len(section)
+    pos = 0
+
+    while pos < n:
+        ch = section[pos]
+        if not (ch.isalnum() or ch == "_"):
+            pos += 1
+            continue
+
+        # Identifier
+        start = pos
+        while pos < n and (section[pos].isalnum() or section[pos] == "_"):
+            pos += 1
+        name = section[start:pos]
+
+        while pos < n and section[pos] in _JS_WS:
+            pos += 1
+        if pos >= n or section[pos] != ":":
+            continue
         pos += 1
+        while pos < n and section[pos] in _JS_WS:
+            pos += 1
+        if pos >= n:
+            break
+
+        ch = section[pos]
+        if ch in "\"'":
+            # Simple format (no arguments)
+            value, pos = _read_js_string(section, pos)
+            if value:
+                macros[name] = (_decode_js_escapes(value), 0)
+        elif ch == "[":
+            # Array format (may have arguments)
+            pos += 1
+            while pos < n and section[pos] in _JS_WS:
+                pos += 1
+            if pos >= n or section[pos] not in "\"'":
+                continue
+            value, pos = _read_js_string(section, pos)
+            if value is None:
+                continue
+            while pos < n and section[pos] in _JS_WS:
+                pos += 1
+            num_args = 0
+            if pos < n and section[pos] == ",":
+                pos += 1
+                while pos < n and section[pos] in _JS_WS:
+                    pos += 1
+                digits_start = pos
+                while pos < n and section[pos].isdigit():
+                    pos += 1
+                if pos > digits_start:
+                    num_args = int(section[digits_start:pos])
+            closing = section.find("]", pos)
+            if closing != -1:
+                pos = closing + 1
+            if value:
+                macros[name] = (_decode_js_escapes(value), num_args)
 
-    macros_section = js_content[brace_start + 1 : pos - 1]
-
-    # Pattern for simple string format: macroName: "expansion" or 'expansion'
-    simple_pattern = re.compile(
-        r'(\w+)\s*:\s*(?:"((?:[^"\\]|\\.)*)"|\'((?:[^\'\\]|\\.)*)\')\s*(?:,|$)',
-        re.MULTILINE,
-    )
+    return macros
 
-    # Pattern for array format: macroName: ["expansion"] or ["expansion", numArgs]
-    array_pattern = re.compile(
-        r'(\w+)\s*:\s*\[\s*"((?:[^"\\]|\\.)*)"\s*(?:,\s*(\d+))?\s*\]',
-        re.MULTILINE,
-    )
 
-    def decode_js_escapes(value: str) -> str:
-        """Decode JavaScript escape sequences."""
-        value = value.replace("\\\\", "\x00")  # Temp placeholder
-        value = value.replace("\\", "")  # Remove single escapes
-        value = value.replace("\x00", "\\")  # Restore double as single
-        return value
-
-    # Parse simple format (no arguments)
-    for match in simple_pattern.finditer(macros_section):
-        name = match.group(1)
-        value = match.group(2) or match.group(3)
-        if value:
-            macros[name] = (decode_js_escapes(value), 0)
-
-    # Parse array format (may have arguments)
-    for match in array_pattern.finditer(macros_section):
-        name = match.group(1)
-        value = match.group(2)
-        num_args = int(match.group(3)) if match.group(3) else 0
-        if value:
-            macros[name] = (decode_js_escapes(value), num_args)
+_ALLOWED_HOSTS = frozenset({"plato.stanford.edu", "seop.illc.uva.nl"})
 
-    return macros
+_VALID_URL_PREFIXES = (
+    "https://plato.stanford.edu/entries/",
+    "http://plato.stanford.edu/entries/",
+    "https://seop.illc.uva.nl/entries/",
+    "http://seop.illc.uva.nl/entries/",
+)
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_sep_url(url: str) -> str:
     """Validate that URL is a SEP article URL.
 
@@ -122,10 +327,15 @@ def validate_sep_url(url: str) -> str:
     Raises:
         ValueError: If URL is not a valid SEP article URL
     """
+    # Valid URLs all share a handful of literal prefixes; a tuple
+    # startswith check covers them without a urlparse per call
+    if url.startswith(_VALID_URL_PREFIXES):
+        return url
+
+    # Fall back to parsing only to pick the precise error message
     parsed = urlparse(url)
-    valid_domains = ("plato.stanford.edu", "seop.illc.uva.nl")
 
-    if parsed.netloc not in valid_domains:
+    if parsed.netloc not in _ALLOWED_HOSTS:
         raise ValueError(f"Not a SEP URL: {url}")
 
     if not parsed.path.startswith("/entries/"):
@@ -134,9 +344,45 @@ def validate_sep_url(url: str) -> str:
     return url
 
 
+def _cache_dir() -> Path | None:
+    """Resolve the on-disk HTML cache directory, if caching is enabled.
+
+    The cache is opt-in via the SEP_SCRAPER_CACHE environment variable so
+    normal library use (and the network-error tests) keep their current
+    behavior. The directory follows XDG conventions.
+
+    Returns:
+        Cache directory path, or None when caching is disabled
+    """
+    if os.environ.get("SEP_SCRAPER_CACHE", "0") in ("", "0"):
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "sep-scraper"
+
+
+def _cache_paths(cache_dir: Path, url: str) -> tuple[Path, Path]:
+    """Content-addressed cache paths for an article URL.
+
+    Args:
+        cache_dir: Root cache directory
+        url: SEP article URL
+
+    Returns:
+        Tuple of (html_path, meta_path); the sidecar meta file stores the
+        validators used to revalidate the cached body
+    """
+    key = hashlib.sha256(url.encode()).hexdigest()
+    base = cache_dir / key[:2]
+    return base / f"{key}.html", base / f"{key}.meta.json"
+
+
 async def fetch_article(url: str) -> str:
     """Fetch HTML content from a SEP article URL.
 
+    When SEP_SCRAPER_CACHE is set, fetched HTML is cached on disk and
+    revalidated with a conditional request on later calls, so an
+    unchanged article costs a bodyless 304 instead of a full download.
+
     Args:
         url: SEP article URL
 
@@ -146,19 +392,166 @@ async def fetch_article(url: str) -> str:
     Raises:
         ScraperError: If fetching fails
     """
-    validate_sep_url(url)
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        result = await fetch_article_conditional(url)
+        return result.text
+
+    html_path, meta_path = _cache_paths(cache_dir, url)
+    meta: dict = {}
+    if html_path.exists():
+        try:
+            meta = json.loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            meta = {}
+
+    try:
+        result = await fetch_article_conditional(
+            url,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            known_sha=meta.get("sha256"),
+        )
+    except NotModified:
+        return html_path.read_text(encoding="utf-8")
+
+    # Write-through: temp file plus rename so an interrupt never leaves a
+    # truncated cache entry behind
+    html_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = html_path.with_suffix(".html.tmp")
+    tmp.write_text(result.text, encoding="utf-8")
+    os.replace(tmp, html_path)
+    meta_path.write_bytes(
+        json.dumps(
+            {
+                "etag": result.etag,
+                "last_modified": result.last_modified,
+                "sha256": result.sha256,
+            }
+        ).encode()
+    )
+    return result.text
+
+
+def _throttle_delay(response: httpx.Response, attempt: int) -> float:
+    """Compute how long to wait before retrying a throttled request.
+
+    Prefers the server's Retry-After header (either delta-seconds or an
+    HTTP-date) and falls back to jittered exponential backoff. Capped at
+    60 seconds either way.
+
+    Args:
+        response: The 429/503 response
+        attempt: Zero-based retry attempt number
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    Returns:
+        Delay in seconds
+    """
+    value = response.headers.get("Retry-After")
+    if value:
         try:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
-            return response.text
-        except httpx.TimeoutException:
-            raise ScraperError(f"Timeout fetching {url}")
-        except httpx.HTTPStatusError as e:
-            raise ScraperError(f"HTTP {e.response.status_code} for {url}")
-        except httpx.RequestError as e:
-            raise ScraperError(f"Network error: {e}")
+            return min(60.0, max(0.0, float(value)))
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+                delta = (when - datetime.now(timezone.utc)).total_seconds()
+                return min(60.0, max(0.0, delta))
+            except (TypeError, ValueError):
+                pass
+    return min(60.0, 2**attempt + random.random())
+
+
+async def fetch_article_conditional(
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    known_sha: str | None = None,
+) -> FetchResult:
+    """Fetch a SEP article, optionally as a conditional request.
+
+    When `etag` or `last_modified` from a previous fetch are supplied, they
+    are sent as If-None-Match / If-Modified-Since headers so an unchanged
+    article costs a bodyless 304 instead of a full download. `known_sha`
+    catches the fallback case where the server sent no validators (some
+    SEP mirrors): if the downloaded body hashes to the same digest, the
+    article is treated as unchanged without parsing it.
+
+    Args:
+        url: SEP article URL
+        etag: ETag from a previous response, if any
+        last_modified: Last-Modified from a previous response, if any
+        known_sha: SHA-256 hex digest of the previously fetched body
+
+    Returns:
+        FetchResult with HTML content, cache validators, and body digest
+
+    Raises:
+        NotModified: If the article is unchanged (304 or matching digest)
+        ScraperError: If fetching fails
+    """
+    validate_sep_url(url)
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        for attempt in range(MAX_FETCH_ATTEMPTS):
+            response = await get_client().get(url, headers=headers)
+            if (
+                response.status_code in (429, 503)
+                and attempt < MAX_FETCH_ATTEMPTS - 1
+            ):
+                delay = _throttle_delay(response, attempt)
+                logger.warning(
+                    f"HTTP {response.status_code} for {url}, "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            break
+        if response.status_code == 304:
+            raise NotModified(f"Not modified: {url}")
+        response.raise_for_status()
+        sha256 = hashlib.sha256(response.content).hexdigest()
+        if known_sha is not None and sha256 == known_sha:
+            raise NotModified(f"Content unchanged: {url}")
+        return FetchResult(
+            text=response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            sha256=sha256,
+        )
+    except httpx.TimeoutException:
+        raise ScraperError(f"Timeout fetching {url}")
+    except httpx.HTTPStatusError as e:
+        raise ScraperError(f"HTTP {e.response.status_code} for {url}")
+    except httpx.RequestError as e:
+        raise ScraperError(f"Network error: {e}")
+
+
+async def fetch_articles(urls: list[str], concurrency: int = 16) -> list[str]:
+    """Fetch several SEP articles with bounded concurrency.
+
+    Args:
+        urls: SEP article URLs
+        concurrency: Maximum number of in-flight requests
+
+    Returns:
+        HTML content strings, in the same order as `urls`
+
+    Raises:
+        ScraperError: If any fetch fails
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> str:
+        async with sem:
+            return await fetch_article(url)
+
+    return await asyncio.gather(*(one(url) for url in urls))
 
 
 async def fetch_appendices(
@@ -176,14 +569,13 @@ async def fetch_appendices(
         return []
 
     async def fetch_one(url: str, title: str) -> tuple[str, str] | None:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(url, follow_redirects=True)
-                response.raise_for_status()
-                return (title, response.text)
-            except (httpx.HTTPStatusError, httpx.RequestError) as e:
-                logger.warning(f"Failed to fetch appendix '{title}': {e}")
-                return None
+        try:
+            response = await get_client().get(url)
+            response.raise_for_status()
+            return (title, response.text)
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            logger.warning(f"Failed to fetch appendix '{title}': {e}")
+            return None
 
     tasks = [fetch_one(url, title) for url, title in appendix_links]
     results = await asyncio.gather(*tasks)
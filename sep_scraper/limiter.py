@@ -0,0 +1,95 @@
+"""Adaptive concurrency limiter for bulk scraping."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter: additive increase, multiplicative decrease.
+
+    Instead of a fixed semaphore, the limit converges on the server's
+    sustainable rate: each clean completion with a normal RTT raises the
+    limit by one, while a failure (429/5xx/timeout surfacing as an
+    exception) or an RTT spike cuts it multiplicatively.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 2,
+        max_limit: int = 64,
+        backoff: float = 0.7,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            min_limit: Floor the limit never drops below
+            max_limit: Ceiling the limit never exceeds
+            backoff: Multiplicative decrease factor applied on congestion
+        """
+        self._limit = initial
+        self._min = min_limit
+        self._max = max_limit
+        self._backoff = backoff
+        self._active = 0
+        self._cond = asyncio.Condition()
+        self._rtt_mean: float | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit
+
+    async def acquire(self) -> None:
+        """Wait until a slot is available under the current limit."""
+        async with self._cond:
+            while self._active >= self._limit:
+                await self._cond.wait()
+            self._active += 1
+
+    async def release(self, success: bool, rtt: float | None = None) -> None:
+        """Release a slot and adjust the limit based on the outcome.
+
+        Args:
+            success: Whether the request completed without error
+            rtt: Wall-clock duration of the request, if measured
+        """
+        async with self._cond:
+            congested = not success
+            if success and rtt is not None:
+                if self._rtt_mean is not None and rtt > 2 * self._rtt_mean:
+                    congested = True
+                # Exponentially weighted moving average of observed RTT
+                if self._rtt_mean is None:
+                    self._rtt_mean = rtt
+                else:
+                    self._rtt_mean = 0.8 * self._rtt_mean + 0.2 * rtt
+
+            if congested:
+                self._limit = max(self._min, int(self._limit * self._backoff))
+            elif self._limit < self._max:
+                self._limit += 1
+
+            self._active -= 1
+            self._cond.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """Acquire a slot for the duration of a request.
+
+        Exceptions escaping the block count as congestion; clean exits
+        count as success with the measured RTT.
+        """
+        await self.acquire()
+        start = time.monotonic()
+        try:
+            yield self
+        except BaseException:
+            await self.release(success=False)
+            raise
+        else:
+            await self.release(success=True, rtt=time.monotonic() - start)
@@ -1,17 +1,32 @@
 """Metadata extraction from SEP articles."""
 
+import functools
 import re
 from datetime import datetime
 
 from bs4 import BeautifulSoup
 
 
+# Date component pattern: "Mon DD, YYYY"
+_DATE_RE = re.compile(r"([A-Za-z]{3})\s+(\d{1,2}),\s+(\d{4})")
+_DATE_MARKER_RE = re.compile(r"first published|substantive revision", re.I)
+# Both dates captured in one scan of the pubinfo line
+_DATES_RE = re.compile(
+    r"first published\s+(?P<pub>.+?)"
+    r"(?:;\s*substantive revision\s+(?P<rev>.+?))?"
+    r"(?:;|$)",
+    re.I,
+)
+_REV_RE = re.compile(r"substantive revision\s+(.+?)(?:;|$)", re.I)
+_AUTHOR_RE = re.compile(r"by\s*\n?\s*(.+?)(?:\s*<|$)")
+
 MONTH_MAP = {
     "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
     "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_date(date_str: str) -> str | None:
     """Parse SEP date format to ISO format.
 
@@ -22,8 +37,7 @@ def _parse_date(date_str: str) -> str | None:
         ISO format date string or None if parsing fails
     """
     # Pattern: Day Mon DD, YYYY
-    pattern = r"([A-Za-z]{3})\s+(\d{1,2}),\s+(\d{4})"
-    match = re.search(pattern, date_str)
+    match = _DATE_RE.search(date_str)
     if not match:
         return None
 
@@ -33,8 +47,11 @@ def _parse_date(date_str: str) -> str | None:
         return None
 
     try:
-        date = datetime(int(year), month, int(day))
-        return date.strftime("%Y-%m-%d")
+        y, d = int(year), int(day)
+        # Construct a datetime purely for calendar validation; formatting
+        # directly skips strftime's format parsing and locale machinery
+        datetime(y, month, d)
+        return f"{y:04d}-{month:02d}-{d:02d}"
     except ValueError:
         return None
 
@@ -59,22 +76,25 @@ def extract_metadata(soup: BeautifulSoup, url: str) -> dict:
 
     # Extract dates from preamble
     # Look for text like "First published ... ; substantive revision ..."
-    date_pattern = re.compile(r"first published|substantive revision", re.I)
-    for elem in soup.find_all(["p", "em"]):
+    metadata["published"] = None
+    metadata["revised"] = None
+    elem = soup.find(
+        lambda t: t.name in ("p", "em") and _DATE_MARKER_RE.search(t.get_text())
+    )
+    if elem is not None:
         text = elem.get_text()
-        if date_pattern.search(text):
-            # Extract first published date
-            if pub_match := re.search(r"first published\s+(.+?)(?:;|$)", text, re.I):
-                metadata["published"] = _parse_date(pub_match.group(1))
-
-            # Extract revision date
-            if rev_match := re.search(r"substantive revision\s+(.+?)(?:;|$)", text, re.I):
-                metadata["revised"] = _parse_date(rev_match.group(1))
-            break
-
-    # Set defaults for missing dates
-    metadata.setdefault("published", None)
-    metadata.setdefault("revised", None)
+        rev = None
+        if dates := _DATES_RE.search(text):
+            metadata["published"] = _parse_date(dates.group("pub"))
+            rev = dates.group("rev")
+        if rev is None:
+            # Revision-only pubinfo lines, and lines with another
+            # ;-delimited segment between the two clauses, where the
+            # fused pattern's optional rev group comes up empty
+            if rev_match := _REV_RE.search(text):
+                rev = rev_match.group(1)
+        if rev:
+            metadata["revised"] = _parse_date(rev)
 
     # Extract author from copyright section
     metadata["author"] = None
@@ -99,7 +119,7 @@ def extract_metadata(soup: BeautifulSoup, url: str) -> dict:
         else:
             # Try to extract from text before email
             text = copyright_div.get_text()
-            if author_match := re.search(r"by\s*\n?\s*(.+?)(?:\s*<|$)", text):
+            if author_match := _AUTHOR_RE.search(text):
                 metadata["author"] = author_match.group(1).strip()
 
     return metadata
@@ -118,7 +138,10 @@ def _quote_value(value) -> str:
         return "null"
     # Quote strings
     if isinstance(value, str):
-        # Escape any double quotes in the string
+        # Titles, authors, and URLs almost never contain quotes; skip the
+        # escape allocation unless one is present
+        if '"' not in value:
+            return f'"{value}"'
         escaped = value.replace('"', '\\"')
         return f'"{escaped}"'
     return str(value)
@@ -133,18 +156,14 @@ def format_frontmatter(metadata: dict) -> str:
     Returns:
         YAML frontmatter string with --- delimiters
     """
-    # Order fields consistently
-    fields = [
-        ("title", metadata.get("title")),
-        ("author", metadata.get("author")),
-        ("published", metadata.get("published")),
-        ("revised", metadata.get("revised")),
-        ("url", metadata.get("url")),
-    ]
-
-    lines = ["---"]
-    for key, value in fields:
-        lines.append(f"{key}: {_quote_value(value)}")
-    lines.append("---")
-
-    return "\n".join(lines) + "\n"
+    # Fields in consistent order, emitted as one f-string allocation
+    q = _quote_value
+    return (
+        "---\n"
+        f"title: {q(metadata.get('title'))}\n"
+        f"author: {q(metadata.get('author'))}\n"
+        f"published: {q(metadata.get('published'))}\n"
+        f"revised: {q(metadata.get('revised'))}\n"
+        f"url: {q(metadata.get('url'))}\n"
+        "---\n"
+    )
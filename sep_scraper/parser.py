@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING
+import copy
+import functools
+from dataclasses import dataclass, field
 from urllib.parse import urljoin
 
 from sep_scraper.converters import (
@@ -13,13 +14,60 @@ from sep_scraper.converters import (
     TableConverter,
     BibliographyConverter,
 )
+from sep_scraper.dom import parse_html
 from sep_scraper.metadata import extract_metadata
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
-if TYPE_CHECKING:
-    from bs4 import Tag
 
+_HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+
+# Headings demoted in appendices: h1 (the site banner) and h6 (already
+# at the floor) keep their levels, matching the original rename pass
+_DEMOTED_HEADING_TAGS = frozenset(("h2", "h3", "h4", "h5"))
+
+
+def _memoized(method):
+    """Cache a zero-argument getter's result on the parser instance.
+
+    The document is never mutated after construction, so the getters are
+    pure; callers that hit the same getter repeatedly (extract_all plus
+    direct use) pay the tree walk once.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        memo = self._memo
+        if name not in memo:
+            memo[name] = method(self)
+        return memo[name]
+
+    return wrapper
+
+
+def _strip_section_num(text: str) -> str:
+    """Strip a leading "1. " style section number from heading text.
+
+    Runs once per heading, so a hand-rolled scan beats spinning up the
+    regex engine for this trivial anchored pattern.
+
+    Args:
+        text: Heading text
+
+    Returns:
+        Heading text without its leading section number
+    """
+    i = 0
+    n = len(text)
+    while i < n and text[i].isdigit():
+        i += 1
+    if i and i < n and text[i] == ".":
+        j = i + 1
+        while j < n and text[j] == " ":
+            j += 1
+        return text[j:]
+    return text
 
 # Sections to exclude from main content
 EXCLUDED_SECTIONS = {
@@ -30,6 +78,32 @@ EXCLUDED_SECTIONS = {
     "appendices",
 }
 
+# Everything skipped during the main-content walk: the excluded sections
+# plus the bibliography headings, merged so the walk does one membership
+# test per heading
+_SKIP_SECTIONS = frozenset(EXCLUDED_SECTIONS | {"bibliography", "references"})
+
+
+@dataclass
+class ParsedArticle:
+    """All components extracted from a SEP article in one pass.
+
+    Attributes:
+        metadata: Article metadata dictionary
+        preamble: Introduction markdown before the first section
+        content: Main article body markdown
+        footnotes: Formatted footnote definitions
+        bibliography: Bibliography markdown
+        appendix_links: (url, title) tuples for each appendix
+    """
+
+    metadata: dict
+    preamble: str
+    content: str
+    footnotes: str
+    bibliography: str
+    appendix_links: list[tuple[str, str]] = field(default_factory=list)
+
 
 class SEPParser:
     """Parse SEP article HTML and extract content."""
@@ -54,7 +128,67 @@ class SEPParser:
         self._footnote_converter = FootnoteConverter(soup)
         self._table_converter = TableConverter()
         self._bib_converter = BibliographyConverter()
+        self._heading_index: dict[str, Tag] | None = None
+        self._memo: dict[str, object] = {}
+
+        # Per-tag dispatch table replaces the elif chain on the hottest
+        # call in the tree walk
+        self._dispatch = {
+            "p": self._convert_paragraph,
+            "ul": self._text_converter.convert,
+            "ol": self._text_converter.convert,
+            "blockquote": self._text_converter.convert,
+            "table": self._table_converter.convert,
+            "div": self._convert_div,
+            **{tag: self._text_converter.convert for tag in _HEADING_TAGS},
+        }
+        # Article content lives in aueditable (or main-text on some
+        # mirrors); cache it so section lookups skip the head, nav, and
+        # sidebar subtrees entirely
+        self._aueditable = soup.find("div", id="aueditable")
+        self._content_root = self._aueditable or soup.find("div", id="main-text")
+
+    @classmethod
+    def from_html(
+        cls,
+        html: str | bytes,
+        url: str,
+        macros: dict[str, tuple[str, int]] | None = None,
+        encoding: str | None = None,
+    ) -> SEPParser:
+        """Construct a parser straight from raw HTML.
+
+        Args:
+            html: Raw article HTML
+            url: Source URL
+            macros: Optional custom MathJax macros
+            encoding: Known encoding of `html` when it is bytes, to skip
+                encoding detection
+
+        Returns:
+            SEPParser over the parsed document
+        """
+        return cls(parse_html(html, encoding=encoding), url, macros)
+
+    def extract_all(self) -> ParsedArticle:
+        """Extract every article component in a single call.
+
+        Callers that need more than one component should use this instead
+        of the individual getters so each subtree is visited once.
 
+        Returns:
+            ParsedArticle with all extracted components
+        """
+        return ParsedArticle(
+            metadata=self.get_metadata(),
+            preamble=self.get_preamble(),
+            content=self.get_main_content(),
+            footnotes=self.get_footnotes(),
+            bibliography=self.get_bibliography(),
+            appendix_links=self.get_appendix_links(),
+        )
+
+    @_memoized
     def get_metadata(self) -> dict:
         """Extract article metadata.
 
@@ -63,6 +197,7 @@ class SEPParser:
         """
         return extract_metadata(self._soup, self._url)
 
+    @_memoized
     def get_preamble(self) -> str:
         """Extract and convert preamble (introduction before first section).
 
@@ -73,19 +208,18 @@ class SEPParser:
         if not preamble_div:
             return ""
 
-        lines = []
+        parts = []
         for element in preamble_div.children:
-            if not hasattr(element, "name"):
+            if not isinstance(element, Tag):
                 continue
             converted = self._convert_element(element)
             if converted:
-                lines.append(converted)
-                lines.append("")
+                parts.append(converted)
 
-        result = "\n".join(lines)
-        result = self._math_converter.convert_text(result)
+        result = self._math_converter.convert_text("\n\n".join(parts))
         return result.strip()
 
+    @_memoized
     def get_main_content(self) -> str:
         """Extract and convert main article content.
 
@@ -95,7 +229,7 @@ class SEPParser:
         # Use aueditable as the content source to handle malformed HTML where
         # orphan </div> tags cause main-text to close prematurely. Content
         # elements may be direct children of aueditable or inside main-text.
-        aueditable = self._soup.find("div", id="aueditable")
+        aueditable = self._aueditable
         if not aueditable:
             return ""
 
@@ -114,7 +248,7 @@ class SEPParser:
         # Collect content elements from aueditable, including from main-text
         content_elements = []
         for element in aueditable.children:
-            if not hasattr(element, "name"):
+            if not isinstance(element, Tag):
                 continue
             # Skip non-content divs
             if element.name == "div" and element.get("id") in non_content_ids:
@@ -125,13 +259,13 @@ class SEPParser:
             # If this is main-text, extract its children
             if element.name == "div" and element.get("id") == "main-text":
                 for child in element.children:
-                    if hasattr(child, "name"):
+                    if isinstance(child, Tag):
                         content_elements.append(child)
             else:
                 # Direct child of aueditable (possibly escaped from main-text)
                 content_elements.append(element)
 
-        lines = []
+        parts = []
         skip_until_next_h2 = False
 
         for element in content_elements:
@@ -139,12 +273,9 @@ class SEPParser:
             if element.name in ("h2", "h3"):
                 heading_text = element.get_text(strip=True).lower()
                 # Remove numbering for comparison
-                heading_text = re.sub(r"^\d+\.\s*", "", heading_text)
+                heading_text = _strip_section_num(heading_text)
 
-                is_excluded = (
-                    heading_text in EXCLUDED_SECTIONS
-                    or heading_text in ("bibliography", "references")
-                )
+                is_excluded = heading_text in _SKIP_SECTIONS
 
                 if element.name == "h2":
                     # h2 always controls skip state
@@ -164,51 +295,59 @@ class SEPParser:
             # Convert element
             converted = self._convert_element(element)
             if converted:
-                lines.append(converted)
-                lines.append("")
-
-        result = "\n".join(lines)
+                parts.append(converted)
 
         # Convert math delimiters in the final text
-        result = self._math_converter.convert_text(result)
+        result = self._math_converter.convert_text("\n\n".join(parts))
 
         return result.strip()
 
-    def _convert_element(self, element: Tag) -> str:
+    def _convert_element(
+        self, element: Tag, heading_offset: int = 0, skip: Tag | None = None
+    ) -> str:
         """Convert a single HTML element to Markdown.
 
         Args:
             element: BeautifulSoup Tag
+            heading_offset: Levels to demote headings by (used for
+                appendices), without mutating the tree
+            skip: A descendant tag to omit from the output (the appendix
+                title heading), threaded through div recursion
 
         Returns:
             Markdown string
         """
-        if element.name in ("h1", "h2", "h3", "h4", "h5", "h6"):
-            return self._text_converter.convert(element)
-
-        elif element.name == "p":
-            return self._convert_paragraph(element)
-
-        elif element.name in ("ul", "ol"):
-            return self._text_converter.convert(element)
-
-        elif element.name == "blockquote":
-            return self._text_converter.convert(element)
-
-        elif element.name == "table":
-            return self._table_converter.convert(element)
+        if heading_offset:
+            name = element.name
+            if name in _DEMOTED_HEADING_TAGS:
+                level = min(int(name[1]) + heading_offset, 6)
+                text = self._text_converter.convert_inline(element)
+                return f"{'#' * level} {text}"
+            if name == "div":
+                return self._convert_div(element, heading_offset, skip)
+        handler = self._dispatch.get(element.name)
+        return handler(element) if handler else ""
+
+    def _convert_div(
+        self, element: Tag, heading_offset: int = 0, skip: Tag | None = None
+    ) -> str:
+        """Convert a div by recursively processing its contents.
 
-        elif element.name == "div":
-            # Recursively process div contents
-            parts = []
-            for child in element.children:
-                if hasattr(child, "name"):
-                    converted = self._convert_element(child)
-                    if converted:
-                        parts.append(converted)
-            return "\n\n".join(parts)
+        Args:
+            element: div tag
+            heading_offset: Levels to demote headings by
+            skip: A descendant tag to omit from the output
 
-        return ""
+        Returns:
+            Markdown string
+        """
+        parts = []
+        for child in element.children:
+            if isinstance(child, Tag) and child is not skip:
+                converted = self._convert_element(child, heading_offset, skip)
+                if converted:
+                    parts.append(converted)
+        return "\n\n".join(parts)
 
     def _convert_paragraph(self, element: Tag) -> str:
         """Convert paragraph with footnote and math handling.
@@ -224,13 +363,23 @@ class SEPParser:
         for child in element.children:
             if isinstance(child, str):
                 result_parts.append(child)
-            elif child.name == "sup" and child.find("a"):
+                continue
+            # One attribute fetch per child; names from the lxml build
+            # aren't guaranteed interned, so equality (which fast-paths
+            # identical pointers anyway) stays the comparison
+            name = child.name
+            if name == "sup" and child.find("a"):
                 # Footnote reference
                 result_parts.append(self._footnote_converter.convert_reference(child))
-            elif child.name == "script" and "math/tex" in child.get("type", ""):
-                # Math element
-                result_parts.append(self._math_converter.convert(child))
-            elif child.name in ("span",) and child.get("class"):
+            elif name == "script":
+                # Math element; the type is "math/tex" or
+                # "math/tex; mode=display", so a prefix check suffices
+                script_type = child.attrs.get("type")
+                if script_type is not None and script_type.startswith("math/tex"):
+                    result_parts.append(self._math_converter.convert(child))
+                else:
+                    result_parts.append(self._text_converter.convert_inline(child))
+            elif name == "span" and child.get("class"):
                 # Possible MathJax span
                 if math_result := self._math_converter.extract_from_span(child):
                     result_parts.append(math_result)
@@ -239,11 +388,11 @@ class SEPParser:
             else:
                 result_parts.append(self._text_converter.convert_inline(child))
 
-        text = "".join(result_parts)
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        # Normalize whitespace; no-arg split is a C-level whitespace
+        # scanner, cheaper than a regex pass over the joined paragraph
+        return " ".join("".join(result_parts).split())
 
+    @_memoized
     def get_footnotes(self) -> str:
         """Get formatted footnote definitions.
 
@@ -252,38 +401,56 @@ class SEPParser:
         """
         return self._footnote_converter.format_definitions()
 
+    def _index_headings(self) -> dict[str, Tag]:
+        """Index h2/h3 headings by normalized text, walking the soup once.
+
+        Returns:
+            Mapping of lowered, number-stripped heading text to the first
+            heading tag bearing it
+        """
+        if self._heading_index is None:
+            index: dict[str, Tag] = {}
+            root = self._content_root or self._soup
+            for heading in root.find_all(["h2", "h3"]):
+                text = _strip_section_num(heading.get_text(strip=True).lower())
+                index.setdefault(text, heading)
+            self._heading_index = index
+        return self._heading_index
+
+    @_memoized
     def get_bibliography(self) -> str:
         """Extract and convert bibliography section.
 
         Returns:
             Markdown bibliography
         """
-        # Find bibliography section
-        for heading in self._soup.find_all(["h2", "h3"]):
-            heading_text = heading.get_text(strip=True).lower()
-            heading_text = re.sub(r"^\d+\.\s*", "", heading_text)
-
-            if heading_text in ("bibliography", "references"):
-                # Check if heading is in a dedicated section div
-                section = heading.parent
-                if (
-                    section.name == "div"
-                    and section.get("id") not in ("main-text", "aueditable")
-                ):
-                    return self._bib_converter.convert(section)
-
-                # Build a virtual section from heading + following siblings
-                section_html = str(heading)
-                for sibling in heading.find_next_siblings():
-                    if sibling.name in ("h2", "h3"):
-                        break
-                    section_html += str(sibling)
-
-                temp_soup = BeautifulSoup(f"<div>{section_html}</div>", "lxml")
-                return self._bib_converter.convert(temp_soup.div)
-
-        return ""
+        # Find bibliography section via the one-pass heading index
+        index = self._index_headings()
+        heading = index.get("bibliography") or index.get("references")
+        if heading is None:
+            return ""
 
+        # Check if heading is in a dedicated section div
+        section = heading.parent
+        if (
+            section.name == "div"
+            and section.get("id") not in ("main-text", "aueditable")
+        ):
+            return self._bib_converter.convert(section)
+
+        # Build a virtual section from copies of the heading and its
+        # following siblings; appending copies leaves the article tree
+        # intact and skips the serialize-and-reparse round trip
+        wrapper = self._soup.new_tag("div")
+        wrapper.append(copy.copy(heading))
+        for sibling in heading.find_next_siblings():
+            if sibling.name in ("h2", "h3"):
+                break
+            wrapper.append(copy.copy(sibling))
+
+        return self._bib_converter.convert(wrapper)
+
+    @_memoized
     def get_appendix_links(self) -> list[tuple[str, str]]:
         """Extract appendix links from Appendices section.
 
@@ -292,20 +459,27 @@ class SEPParser:
         """
         appendix_links = []
 
-        # Find Appendices heading
-        for heading in self._soup.find_all("h2"):
-            heading_text = heading.get_text(strip=True).lower()
-            if heading_text == "appendices":
-                # Find the ul immediately following
-                ul = heading.find_next_sibling("ul")
-                if ul:
-                    for li in ul.find_all("li", recursive=False):
-                        link = li.find("a")
-                        if link and link.get("href"):
-                            url = urljoin(self._url, link["href"])
-                            title = link.get_text(strip=True)
-                            appendix_links.append((url, title))
-                break
+        # Find the Appendices heading; find() stops at the first match
+        # instead of materializing every h2 in the article
+        root = self._content_root or self._soup
+        heading = root.find(
+            lambda t: t.name == "h2"
+            and t.get_text(strip=True).lower() == "appendices"
+        )
+        if heading:
+            # Find the ul immediately following
+            ul = heading.find_next_sibling("ul")
+            if ul:
+                # Direct child iteration with the .a shortcut skips the
+                # generic find machinery per item
+                for li in ul.children:
+                    if not isinstance(li, Tag) or li.name != "li":
+                        continue
+                    link = li.a
+                    if link is not None and link.get("href"):
+                        url = urljoin(self._url, link["href"])
+                        title = link.get_text(strip=True)
+                        appendix_links.append((url, title))
 
         return appendix_links
 
@@ -325,27 +499,21 @@ class SEPParser:
         if not main_text:
             return ""
 
-        # Remove the first h2 (title heading) to avoid duplication with assembler header
+        # Skip the first h2 (title heading) to avoid duplication with the
+        # assembler header; headings are demoted during conversion via
+        # heading_offset, so the appendix tree is never mutated. The
+        # heading may sit inside a wrapper div, so the skip is threaded
+        # through the div recursion rather than checked at the top level
         first_h2 = main_text.find("h2")
-        if first_h2:
-            first_h2.decompose()
-
-        # Demote heading levels (h2->h3, h3->h4, etc.)
-        for heading in main_text.find_all(["h2", "h3", "h4", "h5"]):
-            current_level = int(heading.name[1])
-            new_level = min(current_level + 1, 6)
-            heading.name = f"h{new_level}"
 
         # Convert elements (reuse existing logic)
-        lines = []
+        parts = []
         for element in main_text.children:
-            if not hasattr(element, "name"):
+            if not isinstance(element, Tag) or element is first_h2:
                 continue
-            converted = self._convert_element(element)
+            converted = self._convert_element(element, heading_offset=1, skip=first_h2)
             if converted:
-                lines.append(converted)
-                lines.append("")
+                parts.append(converted)
 
-        result = "\n".join(lines)
-        result = self._math_converter.convert_text(result)
+        result = self._math_converter.convert_text("\n\n".join(parts))
         return result.strip()
@@ -0,0 +1,16 @@
+"""Shared pytest configuration."""
+
+
+def pytest_configure(config):
+    """Warm up the parsing stack before any test runs.
+
+    The first BeautifulSoup parse in a process pays lxml's import and
+    libxml2 initialization; doing a throwaway parse here moves that
+    one-off cost out of the first test's timing. Importing the parser
+    module likewise front-loads its module-level regex compilation.
+    """
+    from bs4 import BeautifulSoup
+
+    BeautifulSoup("<html></html>", "lxml")
+
+    import sep_scraper.parser  # noqa: F401
@@ -8,14 +8,15 @@ from bs4 import BeautifulSoup
 from sep_scraper.converters.footnotes import FootnoteConverter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_soup():
     html_path = Path(__file__).parent.parent / "fixtures" / "sample_footnotes.html"
-    html = html_path.read_text()
-    return BeautifulSoup(html, "lxml")
+    # Hand bytes straight to lxml; the explicit encoding skips both
+    # the Python-side decode and bs4's encoding detection
+    return BeautifulSoup(html_path.read_bytes(), "lxml", from_encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def converter(sample_soup):
     return FootnoteConverter(sample_soup)
 
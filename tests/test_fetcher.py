@@ -83,3 +83,222 @@ class TestFetchAppendices:
         # Should only return the successful fetch
         assert len(results) == 1
         assert results[0][0] == "A. Kripke models"
+
+
+class TestParseMathjaxMacros:
+    def test_parses_simple_macro(self):
+        from sep_scraper.fetcher import _parse_mathjax_macros
+
+        js = 'MathJax.Hub.Config({TeX: {Macros: {RR: "\\\\mathbb{R}"}}});'
+        macros = _parse_mathjax_macros(js)
+
+        assert macros == {"RR": ("\\mathbb{R}", 0)}
+
+    def test_parses_macro_with_arguments(self):
+        from sep_scraper.fetcher import _parse_mathjax_macros
+
+        js = 'Macros: {bold: ["\\\\mathbf{#1}", 1]}'
+        macros = _parse_mathjax_macros(js)
+
+        assert macros == {"bold": ("\\mathbf{#1}", 1)}
+
+    def test_braces_in_expansions_do_not_end_the_section(self):
+        from sep_scraper.fetcher import _parse_mathjax_macros
+
+        js = 'Macros: {pair: ["\\\\langle #1, #2 \\\\rangle", 2], NN: "\\\\mathbb{N}"}'
+        macros = _parse_mathjax_macros(js)
+
+        assert macros["pair"] == ("\\langle #1, #2 \\rangle", 2)
+        assert macros["NN"] == ("\\mathbb{N}", 0)
+
+    def test_returns_empty_without_macros_section(self):
+        from sep_scraper.fetcher import _parse_mathjax_macros
+
+        assert _parse_mathjax_macros("var x = 1;") == {}
+
+
+ARTICLE_URL = "https://plato.stanford.edu/entries/logic-modal/"
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Install an httpx client backed by a MockTransport handler."""
+    import httpx
+
+    import sep_scraper.fetcher as fetcher
+
+    def install(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(fetcher, "_CLIENT", client)
+        return client
+
+    return install
+
+
+class TestFetchArticleConditional:
+    @pytest.mark.asyncio
+    async def test_returns_validators_and_digest(self, mock_client):
+        import hashlib
+
+        import httpx
+
+        from sep_scraper.fetcher import fetch_article_conditional
+
+        body = b"<html>article</html>"
+        mock_client(
+            lambda request: httpx.Response(
+                200, content=body, headers={"ETag": '"v1"', "Last-Modified": "LM"}
+            )
+        )
+
+        result = await fetch_article_conditional(ARTICLE_URL)
+
+        assert result.text == body.decode()
+        assert result.etag == '"v1"'
+        assert result.last_modified == "LM"
+        assert result.sha256 == hashlib.sha256(body).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_sends_conditional_headers(self, mock_client):
+        import httpx
+
+        from sep_scraper.fetcher import fetch_article_conditional
+
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, content=b"<html></html>")
+
+        mock_client(handler)
+        await fetch_article_conditional(ARTICLE_URL, etag='"v1"', last_modified="LM")
+
+        assert seen["if-none-match"] == '"v1"'
+        assert seen["if-modified-since"] == "LM"
+
+    @pytest.mark.asyncio
+    async def test_raises_not_modified_on_304(self, mock_client):
+        import httpx
+
+        from sep_scraper.fetcher import NotModified, fetch_article_conditional
+
+        mock_client(lambda request: httpx.Response(304))
+
+        with pytest.raises(NotModified):
+            await fetch_article_conditional(ARTICLE_URL, etag='"v1"')
+
+    @pytest.mark.asyncio
+    async def test_matching_digest_raises_not_modified(self, mock_client):
+        import hashlib
+
+        import httpx
+
+        from sep_scraper.fetcher import NotModified, fetch_article_conditional
+
+        body = b"<html>article</html>"
+        mock_client(lambda request: httpx.Response(200, content=body))
+
+        with pytest.raises(NotModified):
+            await fetch_article_conditional(
+                ARTICLE_URL, known_sha=hashlib.sha256(body).hexdigest()
+            )
+
+    @pytest.mark.asyncio
+    async def test_retries_throttled_request(self, mock_client):
+        import httpx
+
+        from sep_scraper.fetcher import fetch_article_conditional
+
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, content=b"<html>ok</html>"),
+        ]
+        mock_client(lambda request: responses.pop(0))
+
+        result = await fetch_article_conditional(ARTICLE_URL)
+
+        assert result.text == "<html>ok</html>"
+        assert not responses
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_scraper_error(self, mock_client):
+        import httpx
+
+        from sep_scraper.fetcher import fetch_article_conditional
+
+        mock_client(lambda request: httpx.Response(404))
+
+        with pytest.raises(ScraperError, match="HTTP 404"):
+            await fetch_article_conditional(ARTICLE_URL)
+
+
+class TestDiskCache:
+    @pytest.mark.asyncio
+    async def test_revalidates_and_serves_cached_html(
+        self, mock_client, monkeypatch, tmp_path
+    ):
+        import httpx
+
+        monkeypatch.setenv("SEP_SCRAPER_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        conditional_requests = []
+
+        def handler(request):
+            if "if-none-match" in request.headers:
+                conditional_requests.append(request)
+                return httpx.Response(304)
+            return httpx.Response(
+                200, content=b"<html>cached</html>", headers={"ETag": '"v1"'}
+            )
+
+        mock_client(handler)
+
+        first = await fetch_article(ARTICLE_URL)
+        second = await fetch_article(ARTICLE_URL)
+
+        assert first == second == "<html>cached</html>"
+        # Second call revalidated with the stored ETag and served the
+        # cached body on the 304
+        assert len(conditional_requests) == 1
+
+
+class TestFetchArticles:
+    @pytest.mark.asyncio
+    async def test_preserves_input_order(self, mock_client):
+        import httpx
+
+        from sep_scraper.fetcher import fetch_articles
+
+        urls = [
+            f"https://plato.stanford.edu/entries/entry-{i}/" for i in range(5)
+        ]
+        mock_client(
+            lambda request: httpx.Response(
+                200, content=f"<html>{request.url.path}</html>".encode()
+            )
+        )
+
+        results = await fetch_articles(urls, concurrency=2)
+
+        assert results == [f"<html>/entries/entry-{i}/</html>" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_any_failure_raises(self, mock_client):
+        import httpx
+
+        from sep_scraper.fetcher import fetch_articles
+
+        def handler(request):
+            if "bad" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, content=b"<html>ok</html>")
+
+        mock_client(handler)
+        urls = [
+            "https://plato.stanford.edu/entries/good/",
+            "https://plato.stanford.edu/entries/bad/",
+        ]
+
+        with pytest.raises(ScraperError, match="HTTP 404"):
+            await fetch_articles(urls)
@@ -0,0 +1,93 @@
+"""Tests for adaptive concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from sep_scraper.limiter import AdaptiveLimiter
+
+
+class TestLimitAdjustment:
+    @pytest.mark.asyncio
+    async def test_increases_on_success(self):
+        limiter = AdaptiveLimiter(initial=4, min_limit=2, max_limit=64)
+
+        await limiter.acquire()
+        await limiter.release(success=True, rtt=0.1)
+
+        assert limiter.limit == 5
+
+    @pytest.mark.asyncio
+    async def test_never_exceeds_max_limit(self):
+        limiter = AdaptiveLimiter(initial=4, min_limit=2, max_limit=4)
+
+        await limiter.acquire()
+        await limiter.release(success=True, rtt=0.1)
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_decreases_multiplicatively_on_failure(self):
+        limiter = AdaptiveLimiter(initial=10, min_limit=2, max_limit=64, backoff=0.7)
+
+        await limiter.acquire()
+        await limiter.release(success=False)
+
+        assert limiter.limit == 7
+
+    @pytest.mark.asyncio
+    async def test_never_drops_below_min_limit(self):
+        limiter = AdaptiveLimiter(initial=3, min_limit=2, max_limit=64, backoff=0.5)
+
+        for _ in range(3):
+            await limiter.acquire()
+            await limiter.release(success=False)
+
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_rtt_spike_counts_as_congestion(self):
+        limiter = AdaptiveLimiter(initial=10, min_limit=2, max_limit=64, backoff=0.7)
+
+        # Establish a baseline RTT, then report one more than twice it
+        await limiter.acquire()
+        await limiter.release(success=True, rtt=0.1)
+        await limiter.acquire()
+        await limiter.release(success=True, rtt=0.5)
+
+        # First release increased to 11; the spike cuts by the backoff
+        assert limiter.limit == 7
+
+
+class TestSlotAccounting:
+    @pytest.mark.asyncio
+    async def test_acquire_blocks_at_limit(self):
+        limiter = AdaptiveLimiter(initial=1, min_limit=1, max_limit=1)
+
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await limiter.release(success=True)
+        await asyncio.wait_for(waiter, timeout=1)
+        await limiter.release(success=True)
+
+    @pytest.mark.asyncio
+    async def test_slot_releases_on_success(self):
+        limiter = AdaptiveLimiter(initial=4)
+
+        async with limiter.slot():
+            pass
+
+        assert limiter.limit == 5
+
+    @pytest.mark.asyncio
+    async def test_slot_counts_exception_as_congestion(self):
+        limiter = AdaptiveLimiter(initial=10, backoff=0.7)
+
+        with pytest.raises(RuntimeError):
+            async with limiter.slot():
+                raise RuntimeError("boom")
+
+        assert limiter.limit == 7
@@ -8,11 +8,12 @@ from bs4 import BeautifulSoup
 from sep_scraper.metadata import extract_metadata, format_frontmatter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_soup():
     html_path = Path(__file__).parent / "fixtures" / "sample_preamble.html"
-    html = html_path.read_text()
-    return BeautifulSoup(html, "lxml")
+    # Hand bytes straight to lxml; the explicit encoding skips both
+    # the Python-side decode and bs4's encoding detection
+    return BeautifulSoup(html_path.read_bytes(), "lxml", from_encoding="utf-8")
 
 
 class TestExtractMetadata:
@@ -8,18 +8,40 @@ from bs4 import BeautifulSoup
 from sep_scraper.parser import SEPParser
 
 
-@pytest.fixture
+# Base URL shared by the inline-snippet tests
+TEST_BASE_URL = "https://plato.stanford.edu/entries/test/"
+
+# Links expected from the appendix-extraction snippet, resolved
+# against TEST_BASE_URL
+EXPECTED_APPENDIX_LINKS = [
+    (TEST_BASE_URL + "appendix-A.html", "A. First appendix"),
+    (TEST_BASE_URL + "appendix-B.html", "B. Second appendix"),
+]
+
+
+@pytest.fixture(scope="module")
 def sample_soup():
     html_path = Path(__file__).parent / "fixtures" / "sample_article.html"
-    html = html_path.read_text()
-    return BeautifulSoup(html, "lxml")
+    # Hand bytes straight to lxml; the explicit encoding skips both
+    # the Python-side decode and bs4's encoding detection
+    return BeautifulSoup(html_path.read_bytes(), "lxml", from_encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser(sample_soup):
     return SEPParser(sample_soup, "https://plato.stanford.edu/entries/sample/")
 
 
+@pytest.fixture(scope="module")
+def appendix_parser():
+    # Minimal main document shared by the parse_appendix tests, which
+    # only need a parser instance, not main-article content
+    main_soup = BeautifulSoup(
+        "<html><body><div id='main-text'></div></body></html>", "lxml"
+    )
+    return SEPParser(main_soup, TEST_BASE_URL)
+
+
 class TestPreambleExtraction:
     def test_extracts_preamble(self, parser):
         preamble = parser.get_preamble()
@@ -35,7 +57,7 @@ class TestPreambleExtraction:
         </body></html>
         """
         soup = BeautifulSoup(html, "lxml")
-        parser = SEPParser(soup, "https://plato.stanford.edu/entries/test/")
+        parser = SEPParser(soup, TEST_BASE_URL)
         assert parser.get_preamble() == ""
 
 
@@ -106,13 +128,11 @@ class TestAppendixExtraction:
         </body></html>
         """
         soup = BeautifulSoup(html, "lxml")
-        parser = SEPParser(soup, "https://plato.stanford.edu/entries/test/")
+        parser = SEPParser(soup, TEST_BASE_URL)
 
         links = parser.get_appendix_links()
 
-        assert len(links) == 2
-        assert links[0] == ("https://plato.stanford.edu/entries/test/appendix-A.html", "A. First appendix")
-        assert links[1] == ("https://plato.stanford.edu/entries/test/appendix-B.html", "B. Second appendix")
+        assert links == EXPECTED_APPENDIX_LINKS
 
     def test_returns_empty_list_when_no_appendices(self):
         html = """
@@ -124,20 +144,13 @@ class TestAppendixExtraction:
         </body></html>
         """
         soup = BeautifulSoup(html, "lxml")
-        parser = SEPParser(soup, "https://plato.stanford.edu/entries/test/")
+        parser = SEPParser(soup, TEST_BASE_URL)
 
         links = parser.get_appendix_links()
 
         assert links == []
 
-    def test_parses_appendix_content(self):
-        # Main article HTML (needed for parser initialization)
-        main_html = """
-        <html><body><div id="main-text"><p>Main content</p></div></body></html>
-        """
-        main_soup = BeautifulSoup(main_html, "lxml")
-        parser = SEPParser(main_soup, "https://plato.stanford.edu/entries/test/")
-
+    def test_parses_appendix_content(self, appendix_parser):
         # Appendix HTML - first H2 is page title (removed), subsequent content preserved
         appendix_html = """
         <html><body>
@@ -151,18 +164,14 @@ class TestAppendixExtraction:
         """
         appendix_soup = BeautifulSoup(appendix_html, "lxml")
 
-        content = parser.parse_appendix(appendix_soup)
+        content = appendix_parser.parse_appendix(appendix_soup)
 
         assert "Appendix introduction paragraph." in content
         assert "### Section Title" in content  # H2 demoted to H3
         assert "Section content." in content
         assert "Page Title" not in content  # First H2 (page title) is removed
 
-    def test_demotes_heading_levels(self):
-        main_html = "<html><body><div id='main-text'></div></body></html>"
-        main_soup = BeautifulSoup(main_html, "lxml")
-        parser = SEPParser(main_soup, "https://plato.stanford.edu/entries/test/")
-
+    def test_demotes_heading_levels(self, appendix_parser):
         # First H2 is page title (removed), subsequent headings are demoted
         appendix_html = """
         <html><body>
@@ -177,7 +186,7 @@ class TestAppendixExtraction:
         """
         appendix_soup = BeautifulSoup(appendix_html, "lxml")
 
-        content = parser.parse_appendix(appendix_soup)
+        content = appendix_parser.parse_appendix(appendix_soup)
 
         assert "Page Title" not in content  # First H2 (page title) is removed
         assert "### Level 2" in content  # H2 -> H3